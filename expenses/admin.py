@@ -5,7 +5,9 @@ from .models import Category, Expense, Budget, Alert
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'category_type', 'user', 'created_at']
     list_filter = ['category_type', 'created_at']
+    list_select_related = ['user']
     search_fields = ['name', 'user__username']
+    autocomplete_fields = ['user']
     ordering = ['user', 'name']
 
 
@@ -13,35 +15,31 @@ class CategoryAdmin(admin.ModelAdmin):
 class ExpenseAdmin(admin.ModelAdmin):
     list_display = ['description', 'amount', 'category', 'user', 'date', 'created_at']
     list_filter = ['category', 'date', 'created_at']
+    list_select_related = ['user', 'category']
     search_fields = ['description', 'notes', 'user__username']
+    autocomplete_fields = ['user', 'category', 'budget']
     date_hierarchy = 'date'
     ordering = ['-date', '-created_at']
-    
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related('user', 'category')
+    show_full_result_count = False
 
 
 @admin.register(Budget)
 class BudgetAdmin(admin.ModelAdmin):
     list_display = ['name', 'amount', 'period', 'user', 'start_date', 'end_date', 'is_active']
     list_filter = ['period', 'is_active', 'created_at']
+    list_select_related = ['user', 'category']
     search_fields = ['name', 'user__username']
+    autocomplete_fields = ['user', 'category']
     date_hierarchy = 'start_date'
     ordering = ['-created_at']
-    
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related('user', 'category')
 
 
 @admin.register(Alert)
 class AlertAdmin(admin.ModelAdmin):
     list_display = ['user', 'alert_type', 'budget', 'is_read', 'created_at']
     list_filter = ['alert_type', 'is_read', 'created_at']
+    list_select_related = ['user', 'budget']
     search_fields = ['user__username', 'message']
+    autocomplete_fields = ['user', 'budget']
     ordering = ['-created_at']
-    
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related('user', 'budget')
\ No newline at end of file
+    show_full_result_count = False
@@ -1,4 +1,5 @@
 from django import forms
+from django.contrib.auth import password_validation
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import UserCreationForm
 from .models import Expense, Category, Budget
@@ -6,18 +7,41 @@ from datetime import date
 
 class UserRegistrationForm(UserCreationForm):
     """User registration form"""
-    email = forms.EmailField(required=True)
-    first_name = forms.CharField(max_length=100, required=True)
-    last_name = forms.CharField(max_length=100, required=True)
-    
+    email = forms.EmailField(required=True, widget=forms.EmailInput(attrs={'class': 'form-control'}))
+    first_name = forms.CharField(max_length=100, required=True, widget=forms.TextInput(attrs={'class': 'form-control'}))
+    last_name = forms.CharField(max_length=100, required=True, widget=forms.TextInput(attrs={'class': 'form-control'}))
+    password1 = forms.CharField(
+        label='Password',
+        strip=False,
+        widget=forms.PasswordInput(attrs={'class': 'form-control', 'autocomplete': 'new-password'}),
+        help_text=password_validation.password_validators_help_text_html(),
+    )
+    password2 = forms.CharField(
+        label='Password confirmation',
+        strip=False,
+        widget=forms.PasswordInput(attrs={'class': 'form-control', 'autocomplete': 'new-password'}),
+        help_text='Enter the same password as before, for verification.',
+    )
+
     class Meta:
         model = User
         fields = ['username', 'email', 'first_name', 'last_name', 'password1', 'password2']
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields:
-            self.fields[field].widget.attrs.update({'class': 'form-control'})
+        widgets = {
+            'username': forms.TextInput(attrs={'class': 'form-control'}),
+        }
+
+
+class CategoryChoiceField(forms.ModelChoiceField):
+    """Category dropdown that labels options without going through __str__"""
+    def label_from_instance(self, obj):
+        return obj.name
+
+
+def category_choices(user):
+    """Lean queryset for category dropdowns: just the columns the <option>
+    needs, plus color so Expense.save() can snapshot it without a deferred
+    fetch"""
+    return Category.objects.filter(user=user).only('id', 'name', 'color').order_by('name')
 
 
 class CategoryForm(forms.ModelForm):
@@ -50,9 +74,7 @@ class ExpenseForm(forms.ModelForm):
     def __init__(self, user=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if user:
-            categories = Category.objects.filter(user=user)
-            categories = sorted(categories, key=lambda c: (c.name.lower() == 'other', c.name.lower()))
-            self.fields['category'].queryset = Category.objects.filter(pk__in=[c.pk for c in categories])
+            self.fields['category'].queryset = category_choices(user)
             today = date.today()
             self.fields['budget'].queryset = Budget.objects.filter(
                 user=user,
@@ -86,7 +108,7 @@ class BudgetForm(forms.ModelForm):
     def __init__(self, user=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if user:
-            self.fields['category'].queryset = Category.objects.filter(user=user)
+            self.fields['category'].queryset = category_choices(user)
         self.fields['category'].required = False
         # Set default dates
         if not self.instance.pk:
@@ -106,7 +128,7 @@ class BudgetForm(forms.ModelForm):
 
 class ExpenseFilterForm(forms.Form):
     """Form for filtering expenses"""
-    category = forms.ModelChoiceField(
+    category = CategoryChoiceField(
         queryset=Category.objects.none(),
         required=False,
         empty_label="All Categories",
@@ -136,4 +158,4 @@ class ExpenseFilterForm(forms.Form):
     def __init__(self, user=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if user:
-            self.fields['category'].queryset = Category.objects.filter(user=user)
+            self.fields['category'].queryset = category_choices(user)
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from expenses.models import Budget
+
+
+class Command(BaseCommand):
+    help = 'Deactivate budgets whose end date has passed. Run daily via cron/scheduler.'
+
+    def handle(self, *args, **options):
+        today = timezone.now().date()
+        updated = Budget.objects.filter(
+            is_active=True,
+            end_date__lt=today
+        ).update(is_active=False)
+        self.stdout.write(self.style.SUCCESS(f'Deactivated {updated} stale budget(s).'))
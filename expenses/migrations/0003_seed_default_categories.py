@@ -0,0 +1,39 @@
+from django.db import migrations
+
+DEFAULT_CATEGORIES = [
+    ('Food & Dining', 'food', '#ef4444'),
+    ('Transportation', 'transport', '#3b82f6'),
+    ('Utilities', 'utilities', '#f59e0b'),
+    ('Entertainment', 'entertainment', '#8b5cf6'),
+    ('Healthcare', 'healthcare', '#10b981'),
+    ('Shopping', 'shopping', '#ec4899'),
+    ('Education', 'education', '#6366f1'),
+    ('Housing', 'housing', '#14b8a6'),
+    ('Other', 'other', '#6b7280'),
+]
+
+
+def seed_default_categories(apps, schema_editor):
+    """Create the default category set for users registered before seeding
+    moved out of module import time."""
+    User = apps.get_model('auth', 'User')
+    Category = apps.get_model('expenses', 'Category')
+    for user in User.objects.only('id').iterator(chunk_size=1000):
+        Category.objects.bulk_create(
+            [
+                Category(user=user, name=name, category_type=cat_type, color=color)
+                for name, cat_type, color in DEFAULT_CATEGORIES
+            ],
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0002_expense_budget'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_default_categories, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-09-01 07:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0003_seed_default_categories'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user', '-date', '-created_at'], name='expenses_ex_user_id_19a12b_idx'),
+        ),
+    ]
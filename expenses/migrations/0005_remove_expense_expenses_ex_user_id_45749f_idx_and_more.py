@@ -0,0 +1,35 @@
+# Generated by Django 5.2.17 on 2026-09-01 07:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0004_expense_expenses_ex_user_id_19a12b_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='expense',
+            name='expenses_ex_user_id_45749f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['user', 'is_read', '-created_at'], name='expenses_al_user_id_16b869_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budget',
+            index=models.Index(fields=['user', 'is_active', 'start_date', 'end_date'], name='expenses_bu_user_id_c8110b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budget',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', 'end_date'], name='budget_active_enddate'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user', 'category', 'date'], name='expenses_ex_user_id_8a0d73_idx'),
+        ),
+    ]
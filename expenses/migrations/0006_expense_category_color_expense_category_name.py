@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-09-01 07:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0005_remove_expense_expenses_ex_user_id_45749f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='expense',
+            name='category_color',
+            field=models.CharField(blank=True, max_length=7),
+        ),
+        migrations.AddField(
+            model_name='expense',
+            name='category_name',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+    ]
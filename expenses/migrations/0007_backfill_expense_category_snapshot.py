@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+def backfill_category_snapshot(apps, schema_editor):
+    """Copy category name/color onto existing expenses, one UPDATE per category."""
+    Expense = apps.get_model('expenses', 'Expense')
+    Category = apps.get_model('expenses', 'Category')
+    for category in Category.objects.only('id', 'name', 'color').iterator(chunk_size=1000):
+        Expense.objects.filter(category=category).update(
+            category_name=category.name,
+            category_color=category.color,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0006_expense_category_color_expense_category_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_category_snapshot, migrations.RunPython.noop),
+    ]
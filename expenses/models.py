@@ -1,25 +1,25 @@
 ﻿from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
+from django.utils.functional import cached_property
 from decimal import Decimal
 
 class Category(models.Model):
     """Expense categories"""
-    CATEGORY_TYPES = [
-        ('food', 'Food & Dining'),
-        ('transport', 'Transportation'),
-        ('utilities', 'Utilities'),
-        ('entertainment', 'Entertainment'),
-        ('healthcare', 'Healthcare'),
-        ('shopping', 'Shopping'),
-        ('education', 'Education'),
-        ('housing', 'Housing'),
-        ('other', 'Other'),
-    ]
-    
+    class CategoryType(models.TextChoices):
+        FOOD = 'food', 'Food & Dining'
+        TRANSPORT = 'transport', 'Transportation'
+        UTILITIES = 'utilities', 'Utilities'
+        ENTERTAINMENT = 'entertainment', 'Entertainment'
+        HEALTHCARE = 'healthcare', 'Healthcare'
+        SHOPPING = 'shopping', 'Shopping'
+        EDUCATION = 'education', 'Education'
+        HOUSING = 'housing', 'Housing'
+        OTHER = 'other', 'Other'
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='categories')
     name = models.CharField(max_length=100)
-    category_type = models.CharField(max_length=20, choices=CATEGORY_TYPES, default='other')
+    category_type = models.CharField(max_length=20, choices=CategoryType.choices, default=CategoryType.OTHER)
     description = models.TextField(blank=True, null=True)
     color = models.CharField(max_length=7, default='#6366f1')  # Hex color code
     created_at = models.DateTimeField(auto_now_add=True)
@@ -37,6 +37,10 @@ class Expense(models.Model):
     """Individual expense records"""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='expenses')
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, related_name='expenses')
+    # Snapshot of the category at save time, so read paths can group
+    # without joining Category
+    category_name = models.CharField(max_length=100, blank=True)
+    category_color = models.CharField(max_length=7, blank=True)
     budget = models.ForeignKey('Budget', on_delete=models.SET_NULL, null=True, blank=True)
     amount = models.DecimalField(
         max_digits=10, 
@@ -53,22 +57,33 @@ class Expense(models.Model):
         ordering = ['-date', '-created_at']
         indexes = [
             models.Index(fields=['user', 'date']),
-            models.Index(fields=['user', 'category']),
+            models.Index(fields=['user', 'category', 'date']),
+            models.Index(fields=['user', '-date', '-created_at']),
         ]
     
+    def save(self, *args, **kwargs):
+        # Keep the denormalized category snapshot in sync
+        if self.category:
+            self.category_name = self.category.name
+            self.category_color = self.category.color
+        else:
+            self.category_name = ''
+            self.category_color = ''
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.description} - ₱{self.amount}"
 
 
 class Budget(models.Model):
     """Budget limits for categories"""
-    PERIOD_CHOICES = [
-        ('daily', 'Daily'),
-        ('weekly', 'Weekly'),
-        ('monthly', 'Monthly'),
-        ('yearly', 'Yearly'),
-    ]
-    
+    class Period(models.TextChoices):
+        DAILY = 'daily', 'Daily'
+        WEEKLY = 'weekly', 'Weekly'
+        MONTHLY = 'monthly', 'Monthly'
+        YEARLY = 'yearly', 'Yearly'
+
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='budgets')
     category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='budgets', null=True, blank=True)
     name = models.CharField(max_length=100)
@@ -77,7 +92,7 @@ class Budget(models.Model):
         decimal_places=2,
         validators=[MinValueValidator(Decimal('0.01'))]
     )
-    period = models.CharField(max_length=10, choices=PERIOD_CHOICES, default='monthly')
+    period = models.CharField(max_length=10, choices=Period.choices, default=Period.MONTHLY)
     start_date = models.DateField()
     end_date = models.DateField()
     alert_threshold = models.IntegerField(default=80, help_text="Alert when % of budget is reached")
@@ -87,12 +102,25 @@ class Budget(models.Model):
     
     class Meta:
         ordering = ['-created_at']
-    
+        indexes = [
+            models.Index(fields=['user', 'is_active', 'start_date', 'end_date']),
+            models.Index(
+                fields=['user', 'end_date'],
+                condition=models.Q(is_active=True),
+                name='budget_active_enddate',
+            ),
+        ]
+
     def __str__(self):
         return f"{self.name} - ₱{self.amount}"
     
-    def get_spent_amount(self):
-        """Calculate total spent for this budget"""
+    @cached_property
+    def spent_amount(self):
+        """Total spent for this budget, cached on the instance"""
+        # Reuse the value when the queryset was annotated with `spent`
+        spent = getattr(self, 'spent', None)
+        if spent is not None:
+            return spent
         expenses = Expense.objects.filter(
             user=self.user,
             date__gte=self.start_date,
@@ -101,22 +129,25 @@ class Budget(models.Model):
         if self.category:
             expenses = expenses.filter(category=self.category)
         return expenses.aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
-    
+
+    def get_spent_amount(self):
+        """Calculate total spent for this budget"""
+        return self.spent_amount
+
     def get_remaining_amount(self):
         """Calculate remaining budget"""
-        return self.amount - self.get_spent_amount()
-    
+        return self.amount - self.spent_amount
+
     def get_percentage_used(self):
         """Calculate percentage of budget used"""
-        spent = self.get_spent_amount()
         if self.amount > 0:
-            return (spent / self.amount) * 100
+            return (self.spent_amount / self.amount) * 100
         return 0
-    
+
     def is_over_budget(self):
         """Check if budget is exceeded"""
-        return self.get_spent_amount() > self.amount
-    
+        return self.spent_amount > self.amount
+
     def is_alert_threshold_reached(self):
         """Check if alert threshold is reached"""
         return self.get_percentage_used() >= self.alert_threshold
@@ -124,22 +155,24 @@ class Budget(models.Model):
 
 class Alert(models.Model):
     """Budget alerts and notifications"""
-    ALERT_TYPES = [
-        ('threshold', 'Threshold Reached'),
-        ('exceeded', 'Budget Exceeded'),
-        ('reminder', 'Budget Reminder'),
-    ]
-    
+    class AlertType(models.TextChoices):
+        THRESHOLD = 'threshold', 'Threshold Reached'
+        EXCEEDED = 'exceeded', 'Budget Exceeded'
+        REMINDER = 'reminder', 'Budget Reminder'
+
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='alerts')
     budget = models.ForeignKey(Budget, on_delete=models.CASCADE, related_name='alerts', null=True, blank=True)
-    alert_type = models.CharField(max_length=20, choices=ALERT_TYPES)
+    alert_type = models.CharField(max_length=20, choices=AlertType.choices)
     message = models.TextField()
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         ordering = ['-created_at']
-    
+        indexes = [
+            models.Index(fields=['user', 'is_read', '-created_at']),
+        ]
+
     def __str__(self):
-        budget = models.ForeignKey('Budget', on_delete=models.SET_NULL, null=True, blank=True)
         return f"{self.get_alert_type_display()} - {self.user.username}"
\ No newline at end of file
@@ -1,8 +1,10 @@
 ﻿from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.core.paginator import Paginator
 from django.contrib.auth import login
 from django.contrib import messages
-from django.db.models import Sum, Count, Q
+from django.db.models import Sum, Count, Q, Subquery, OuterRef, Case, When, Value, DecimalField, BooleanField
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -32,13 +34,10 @@ def register(request):
                 ('Housing', 'housing', '#14b8a6'),
                 ('Other', 'other', '#6b7280'),
             ]
-            for name, cat_type, color in default_categories:
-                Category.objects.create(
-                    user=user,
-                    name=name,
-                    category_type=cat_type,
-                    color=color
-                )
+            Category.objects.bulk_create([
+                Category(user=user, name=name, category_type=cat_type, color=color)
+                for name, cat_type, color in default_categories
+            ])
             login(request, user)
             messages.success(request, 'Registration successful! Welcome to Expense Tracker.')
             return redirect('expenses:dashboard')
@@ -50,7 +49,6 @@ def register(request):
 
 @login_required
 def dashboard(request):
-    auto_deactivate_budgets(request.user)
     """Main dashboard view"""
     user = request.user
     today = timezone.now().date()
@@ -63,61 +61,51 @@ def dashboard(request):
         date__lte=today
     )
     
-    # Calculate statistics
-    total_expenses = month_expenses.aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
-    expense_count = month_expenses.count()
+    # Calculate statistics in one aggregate pass
+    month_stats = month_expenses.aggregate(total=Sum('amount'), count=Count('id'))
+    total_expenses = month_stats['total'] or Decimal('0.00')
+    expense_count = month_stats['count']
     
-    # Get expenses by category
+    # Get expenses by category from the denormalized snapshot columns,
+    # so the chart aggregation never touches the Category table
     expenses_by_category = month_expenses.values(
-        'category__name', 'category__color'
+        'category_name', 'category_color'
     ).annotate(
         total=Sum('amount'),
         count=Count('id')
     ).order_by('-total')
     
     # Get recent expenses
-    recent_expenses = Expense.objects.filter(user=user).order_by('-date', '-created_at')[:5]
+    recent_expenses = Expense.objects.filter(user=user).select_related('category').order_by('-date', '-created_at')[:5]
     
-    # Get active budgets
-    active_budgets = Budget.objects.filter(
+    # Get active budgets with spent amounts annotated in a single query
+    active_budgets = annotate_budget_spent(Budget.objects.filter(
         user=user,
         is_active=True,
         start_date__lte=today,
         end_date__gte=today
-    )
-    
+    ))
+
     # Calculate budget status
     budget_data = []
     for budget in active_budgets:
-        spent = budget.get_spent_amount()
-        percentage = budget.get_percentage_used()
-        remaining = budget.get_remaining_amount()
-        
+        spent = budget.spent
+        percentage = (spent / budget.amount) * 100 if budget.amount > 0 else 0
+
         budget_data.append({
             'budget': budget,
             'spent': spent,
             'percentage': percentage,
-            'remaining': remaining,
-            'is_over': budget.is_over_budget(),
-            'is_alert': budget.is_alert_threshold_reached()
+            'remaining': budget.amount - spent,
+            'is_over': spent > budget.amount,
+            'is_alert': percentage >= budget.alert_threshold
         })
     
     # Get unread alerts
-    unread_alerts = Alert.objects.filter(user=user, is_read=False).order_by('-created_at')[:5]
+    unread_alerts = Alert.objects.filter(user=user, is_read=False).select_related('budget').order_by('-created_at')[:5]
     
     # Get daily expenses for the last 7 days
-    week_ago = today - timedelta(days=6)
-    daily_expenses = []
-    for i in range(7):
-        day = week_ago + timedelta(days=i)
-        day_total = Expense.objects.filter(
-            user=user,
-            date=day
-        ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
-        daily_expenses.append({
-            'date': day,
-            'total': float(day_total)
-        })
+    daily_expenses = get_daily_expense_totals(user, today - timedelta(days=6), today)
     
     context = {
         'total_expenses': total_expenses,
@@ -136,26 +124,34 @@ def dashboard(request):
 def expense_list(request):
     """List all expenses with filtering"""
     user = request.user
-    expenses = Expense.objects.filter(user=user)
-    
-    # Apply filters
+    expenses = Expense.objects.filter(user=user).select_related('category')
+
+    # Apply filters as a single combined WHERE clause
     filter_form = ExpenseFilterForm(user=user, data=request.GET)
     if filter_form.is_valid():
-        if filter_form.cleaned_data.get('category'):
-            expenses = expenses.filter(category=filter_form.cleaned_data['category'])
-        if filter_form.cleaned_data.get('start_date'):
-            expenses = expenses.filter(date__gte=filter_form.cleaned_data['start_date'])
-        if filter_form.cleaned_data.get('end_date'):
-            expenses = expenses.filter(date__lte=filter_form.cleaned_data['end_date'])
-        if filter_form.cleaned_data.get('min_amount'):
-            expenses = expenses.filter(amount__gte=filter_form.cleaned_data['min_amount'])
-        if filter_form.cleaned_data.get('max_amount'):
-            expenses = expenses.filter(amount__lte=filter_form.cleaned_data['max_amount'])
-    
-    total = expenses.aggregate(total=Sum('amount'))['total' or Decimal('0.00')]
+        cleaned = filter_form.cleaned_data
+        filters = {}
+        if cleaned.get('category'):
+            filters['category'] = cleaned['category']
+        if cleaned.get('start_date'):
+            filters['date__gte'] = cleaned['start_date']
+        if cleaned.get('end_date'):
+            filters['date__lte'] = cleaned['end_date']
+        if cleaned.get('min_amount'):
+            filters['amount__gte'] = cleaned['min_amount']
+        if cleaned.get('max_amount'):
+            filters['amount__lte'] = cleaned['max_amount']
+        if filters:
+            expenses = expenses.filter(**filters)
     
+    total = expenses.aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
+
+    paginator = Paginator(expenses, 50)
+    page_obj = paginator.get_page(request.GET.get('page'))
+
     context = {
-        'expenses': expenses,
+        'expenses': page_obj,
+        'page_obj': page_obj,
         'filter_form': filter_form,
         'total': total,
     }
@@ -241,18 +237,27 @@ def category_create(request):
 # Budget Views
 @login_required
 def budget_list(request):
-    auto_deactivate_budgets(request.user)
     """List all budgets"""
-    budgets = Budget.objects.filter(user=request.user)
-    
+    today = timezone.now().date()
+    budgets = annotate_budget_spent(
+        Budget.objects.filter(user=request.user).annotate(
+            effective_active=Case(
+                When(end_date__lt=today, then=Value(False)),
+                default='is_active',
+                output_field=BooleanField(),
+            )
+        )
+    )
+
     budget_data = []
     for budget in budgets:
+        spent = budget.spent
         budget_data.append({
             'budget': budget,
-            'spent': budget.get_spent_amount(),
-            'percentage': budget.get_percentage_used(),
-            'remaining': budget.get_remaining_amount(),
-            'is_over': budget.is_over_budget(),
+            'spent': spent,
+            'percentage': (spent / budget.amount) * 100 if budget.amount > 0 else 0,
+            'remaining': budget.amount - spent,
+            'is_over': spent > budget.amount,
         })
     
     return render(request, 'expenses/budget_list.html', {'budget_data': budget_data})
@@ -299,72 +304,108 @@ def budget_delete(request, pk):
     return render(request, 'expenses/budget_confirm_delete.html', {'budget': budget})
 
 
-# Helper function
+# Helper functions
+def annotate_budget_spent(budgets):
+    """Annotate each budget with its total spent amount in a single query."""
+    expenses = Expense.objects.filter(
+        user=OuterRef('user'),
+        date__gte=OuterRef('start_date'),
+        date__lte=OuterRef('end_date')
+    )
+    spent_for_category = expenses.filter(
+        category=OuterRef('category')
+    ).values('user').annotate(total=Sum('amount')).values('total')
+    spent_overall = expenses.values('user').annotate(total=Sum('amount')).values('total')
+
+    return budgets.annotate(
+        spent=Coalesce(
+            Case(
+                When(category__isnull=True, then=Subquery(spent_overall)),
+                default=Subquery(spent_for_category),
+            ),
+            Value(Decimal('0.00')),
+            output_field=DecimalField(max_digits=10, decimal_places=2),
+        )
+    )
+
+
+def get_daily_expense_totals(user, start, end):
+    """Per-day expense totals over [start, end], with missing days filled in.
+
+    The grouping happens in SQL on the date column (already day-granular,
+    so no TruncDate cast is needed); Python only fills the gaps.
+    """
+    by_day = {
+        row['date']: float(row['total'])
+        for row in Expense.objects.filter(
+            user=user,
+            date__gte=start,
+            date__lte=end
+        ).values('date').annotate(total=Sum('amount'))
+    }
+    return [
+        {'date': day, 'total': by_day.get(day, 0.0)}
+        for day in (start + timedelta(days=i) for i in range((end - start).days + 1))
+    ]
+
+
 def check_budget_alerts(user, expense):
-    """Check if any budgets need alerts after adding an expense"""
-    today = timezone.now().date()
+    """Check if any budgets need alerts after adding an expense.
+
+    Each budget's spent total is read once from the annotated queryset,
+    so formatting the alert messages issues no extra queries.
+    """
     relevant_budgets = Budget.objects.filter(
         user=user,
         is_active=True,
         start_date__lte=expense.date,
         end_date__gte=expense.date
     )
-    
+
     if expense.category:
         relevant_budgets = relevant_budgets.filter(
             Q(category=expense.category) | Q(category__isnull=True)
         )
-    
-    for budget in relevant_budgets:
-        if budget.is_over_budget():
-            Alert.objects.create(
+
+    budgets = list(annotate_budget_spent(relevant_budgets))
+    if not budgets:
+        return
+
+    # Only create threshold alerts for budgets not already alerted
+    already_alerted = set(Alert.objects.filter(
+        user=user,
+        budget_id__in=[budget.pk for budget in budgets],
+        alert_type=Alert.AlertType.THRESHOLD
+    ).values_list('budget_id', flat=True))
+
+    alerts = []
+    for budget in budgets:
+        spent = budget.spent
+        percentage = (spent / budget.amount) * 100 if budget.amount > 0 else 0
+        if spent > budget.amount:
+            alerts.append(Alert(
                 user=user,
                 budget=budget,
-                alert_type='exceeded',
-                message=f'Budget "{budget.name}" has been exceeded! You have spent ₱{budget.get_spent_amount()} of ₱{budget.amount}.'
-            )
-        elif budget.is_alert_threshold_reached():
-            # Only create alert if not already alerted
-            existing_alert = Alert.objects.filter(
+                alert_type=Alert.AlertType.EXCEEDED,
+                message=f'Budget "{budget.name}" has been exceeded! You have spent ₱{spent} of ₱{budget.amount}.'
+            ))
+        elif percentage >= budget.alert_threshold and budget.pk not in already_alerted:
+            alerts.append(Alert(
                 user=user,
                 budget=budget,
-                alert_type='threshold'
-            ).exists()
-            if not existing_alert:
-                Alert.objects.create(
-                    user=user,
-                    budget=budget,
-                    alert_type='threshold',
-                    message=f'Budget "{budget.name}" has reached {budget.alert_threshold}% threshold!'
-                )
+                alert_type=Alert.AlertType.THRESHOLD,
+                message=f'Budget "{budget.name}" has reached {budget.alert_threshold}% threshold!'
+            ))
+    if alerts:
+        Alert.objects.bulk_create(alerts)
 
 def ensure_other_category(user):
     """Ensure the 'Other' category exists for the user."""
-    if not Category.objects.filter(user=user, name__iexact="Other").exists():
-        Category.objects.create(
-            user=user,
-            name="Other",
-            category_type="other",
-            color="#6b7280"
-        )
-
-# Create default categories for all existing users
-default_categories = [
-    ('Food & Dining', 'food', '#ef4444'),
-    ('Transportation', 'transport', '#3b82f6'),
-    ('Utilities', 'utilities', '#f59e0b'),
-    ('Entertainment', 'entertainment', '#8b5cf6'),
-    ('Healthcare', 'healthcare', '#10b981'),
-    ('Shopping', 'shopping', '#ec4899'),
-    ('Education', 'education', '#6366f1'),
-    ('Housing', 'housing', '#14b8a6'),
-    ('Other', 'other', '#6b7280'),
-]
-
-
-from django.utils import timezone
-
-def auto_deactivate_budgets(user):
-    """Deactivate budgets whose end_date has passed."""
-    today = timezone.now().date()
-    Budget.objects.filter(user=user, is_active=True, end_date__lt=today).update(is_active=False)
\ No newline at end of file
+    Category.objects.get_or_create(
+        user=user,
+        name="Other",
+        defaults={
+            'category_type': Category.CategoryType.OTHER,
+            'color': "#6b7280",
+        }
+    )